@@ -1,15 +1,26 @@
+import asyncio
+import csv
+import hashlib
+import html
+import httpx
+import threading
 import streamlit as st
+import streamlit.components.v1 as components
 import openai
 import anthropic
 import google.generativeai as genai
-from typing import Dict, Any
+from typing import Dict, AsyncIterator, Awaitable, Callable, List, Optional, Tuple
 import json
-import sys
+import re
 import warnings
-from datetime import datetime, date, time
+from contextvars import ContextVar
+from functools import partial
+from datetime import date, time
 import requests
-from io import BytesIO
-import base64
+from io import StringIO
+from queue import Empty, Queue
+from time import monotonic
+from tenacity import AsyncRetrying, retry_if_result, stop_after_attempt, wait_exponential
 
 # Suppress warnings
 warnings.filterwarnings("ignore")
@@ -21,29 +32,229 @@ st.set_page_config(
     layout="wide"
 )
 
+# Generated responses are reused for an hour before the provider is asked again
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Connection pooling shared by the OpenAI and Anthropic SDK clients; the timeout leaves room for DALL-E 3
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=8)
+HTTP_RETRIES = 2
+HTTP_TIMEOUT = 60.0
+
+# Defaults for pacing bulk generation under provider rate limits
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_RPM_LIMIT = 100
+RATE_LIMIT_MAX_ATTEMPTS = 5
+
+# Retries the OpenAI and Anthropic SDKs make on their own, matching their defaults
+SDK_MAX_RETRIES = 2
+
+# Seconds between status checks of a submitted provider batch job
+BATCH_POLL_INTERVAL = 30
+
+# Columns expected in the bulk events CSV
+BULK_EVENT_COLUMNS = ("event_name", "description", "date", "time", "venue")
+
+# Static sidebar and results data, built once at import instead of on every rerun
+AI_PROVIDERS = {
+    "OpenAI (GPT + DALL-E)": "openai",
+    "Anthropic (Claude)": "claude",
+    "Google (Gemini)": "gemini"
+}
+
+TONES = (
+    "Professional",
+    "Casual",
+    "Enthusiastic",
+    "Sarcastic",
+    "Humorous",
+    "Inspirational",
+    "Urgent",
+    "Friendly"
+)
+
+PLATFORMS = ("LinkedIn", "Twitter", "WhatsApp")
+
+# Platform-specific character limits
+LIMITS = {"LinkedIn": 700, "Twitter": 280, "WhatsApp": 500}
+
+# Model used by each provider per speed tier; the fast tier suits short social posts
+MODEL_TIERS = {
+    "Fast": {
+        "openai": "gpt-4o-mini",
+        "claude": "claude-3-5-haiku-20241022",
+        "gemini": "gemini-1.5-flash"
+    },
+    "Quality": {
+        "openai": "gpt-4o",
+        "claude": "claude-3-5-sonnet-20241022",
+        "gemini": "gemini-1.5-pro"
+    }
+}
+
+# Output token budget per platform, sized to its character limit with ~25% headroom because
+# emoji, hashtags and escaped newlines take far fewer than 4 characters per token
+PLATFORM_MAX_TOKENS = {"LinkedIn": 220, "Twitter": 90, "WhatsApp": 160}
+
+# The combined JSON response needs every platform's budget plus room for keys, quotes and escapes
+MULTI_PLATFORM_MAX_TOKENS = sum(PLATFORM_MAX_TOKENS.values()) + 60
+
+# Appended by the providers to a response that stopped because it reached max_tokens
+OUTPUT_BUDGET_EXHAUSTED = "\n[output budget exhausted]"
+
+# Platform-specific writing guidelines
+PLATFORM_SPECS = {
+    "LinkedIn": {
+        "limit": "700 characters",
+        "style": "professional networking post with business language",
+        "features": "Include relevant hashtags, professional call-to-action, and networking angle"
+    },
+    "Twitter": {
+        "limit": "280 characters",
+        "style": "concise and engaging tweet",
+        "features": "Include relevant hashtags, mentions, and compelling hook"
+    },
+    "WhatsApp": {
+        "limit": "500 characters",
+        "style": "casual and personal message",
+        "features": "Use emojis, friendly tone, and personal invitation style"
+    }
+}
+
+# The platform requirements are baked in once; only the event details are substituted per call
+MULTI_PLATFORM_PROMPT_TEMPLATE = """
+    Create a post for each of LinkedIn, Twitter, and WhatsApp about the following event:
+
+    Event Name: {{event_name}}
+    Event Description: {{event_description}}
+    Date: {{event_date}}
+    Time: {{event_time}}
+    Venue: {{venue}}
+    Tone: {{tone}}
+
+    Requirements for every post:
+    - Tone should be {{tone}}
+    - MUST include date, time, and venue information
+    - Make it engaging and action-oriented
+    {platform_requirements}
+
+    Respond with a single JSON object with exactly the keys "LinkedIn", "Twitter", and "WhatsApp",
+    each mapping to that platform's post content as a string.
+    Generate only the JSON object, no additional explanation.
+    """.format(platform_requirements="\n".join(
+    f"""
+    {platform}:
+    - Maximum {spec['limit']}
+    - Style: {spec['style']}
+    - {spec['features']}"""
+    for platform, spec in PLATFORM_SPECS.items()
+))
+
+
+def create_http_client() -> httpx.Client:
+    """Create a pooled HTTP client for the synchronous provider SDKs"""
+    transport = httpx.HTTPTransport(retries=HTTP_RETRIES, limits=HTTP_POOL_LIMITS)
+    return httpx.Client(transport=transport, timeout=HTTP_TIMEOUT)
+
+
+def create_async_http_client() -> httpx.AsyncClient:
+    """Create a pooled HTTP client for the async provider SDKs, bound to the provider event loop"""
+    transport = httpx.AsyncHTTPTransport(retries=HTTP_RETRIES, limits=HTTP_POOL_LIMITS)
+    return httpx.AsyncClient(transport=transport, timeout=HTTP_TIMEOUT)
+
+
+# SDK retries for the async clients; run_rate_limited turns them off because it retries 429s itself
+sdk_max_retries: ContextVar[int] = ContextVar("sdk_max_retries", default=SDK_MAX_RETRIES)
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Start the long-lived event loop that every async provider call runs on
+
+    Async SDK clients and their connection pools are bound to the loop they first run on,
+    so keeping a single loop alive in a background thread lets them be cached across reruns.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="provider-event-loop", daemon=True).start()
+    return loop
+
+
+@st.cache_resource(show_spinner=False)
+def get_async_openai_client(api_key: str, max_retries: int = SDK_MAX_RETRIES) -> openai.AsyncOpenAI:
+    """Return a shared async OpenAI client; only used on the provider event loop"""
+    return openai.AsyncOpenAI(api_key=api_key, max_retries=max_retries, http_client=create_async_http_client())
+
+
+@st.cache_resource(show_spinner=False)
+def get_async_anthropic_client(api_key: str, max_retries: int = SDK_MAX_RETRIES) -> anthropic.AsyncAnthropic:
+    """Return a shared async Anthropic client; only used on the provider event loop"""
+    return anthropic.AsyncAnthropic(api_key=api_key, max_retries=max_retries, http_client=create_async_http_client())
+
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    """Return a shared OpenAI client so its connection pool is reused across calls"""
+    return openai.OpenAI(api_key=api_key, http_client=create_http_client())
+
+
+@st.cache_resource(show_spinner=False)
+def get_anthropic_client(api_key: str) -> anthropic.Anthropic:
+    """Return a shared Anthropic client so its connection pool is reused across calls"""
+    return anthropic.Anthropic(api_key=api_key, http_client=create_http_client())
+
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_model(api_key: str, model: str) -> genai.GenerativeModel:
+    """Return a shared Gemini model bound to the given API key; only used on the provider event loop
+
+    genai keeps one global client that a model picks up lazily on its first generation, so callers
+    must await the model straight away: configure and binding then happen with no await in between.
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model)
+
+
+def mark_budget_exhausted(content: str, exhausted: bool) -> str:
+    """Tag a response that the provider cut off at its max_tokens budget"""
+    return content + OUTPUT_BUDGET_EXHAUSTED if exhausted else content
+
+
+def split_budget_exhausted(content: str) -> Tuple[str, bool]:
+    """Strip the output budget tag, reporting whether the response was cut off"""
+    if content.endswith(OUTPUT_BUDGET_EXHAUSTED):
+        return content[:-len(OUTPUT_BUDGET_EXHAUSTED)], True
+    return content, False
+
+
+class ProviderError(Exception):
+    """Raised when a streamed provider response fails after it has started"""
+
 
 class AIProviders:
     @staticmethod
-    def openai_generate(api_key: str, prompt: str) -> str:
-        """Generate content using OpenAI GPT"""
+    async def openai_generate_async(api_key: str, prompt: str, model: str, json_output: bool = False,
+                                    max_tokens: int = 500) -> str:
+        """Generate content using OpenAI GPT without blocking the event loop"""
         try:
-            client = openai.OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model="gpt-3.5-turbo",
+            client = get_async_openai_client(api_key, sdk_max_retries.get())
+            response = await client.chat.completions.create(
+                model=model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.7
+                max_tokens=max_tokens,
+                temperature=0.7,
+                response_format={"type": "json_object" if json_output else "text"}
             )
-            return response.choices[0].message.content
+            choice = response.choices[0]
+            return mark_budget_exhausted(choice.message.content, choice.finish_reason == "length")
         except Exception as e:
             return f"Error with OpenAI: {str(e)}"
 
     @staticmethod
-    def openai_generate_image(api_key: str, prompt: str) -> str:
-        """Generate image using OpenAI DALL-E"""
+    async def openai_generate_image_async(api_key: str, prompt: str) -> str:
+        """Generate image using OpenAI DALL-E without blocking the event loop"""
         try:
-            client = openai.OpenAI(api_key=api_key)
-            response = client.images.generate(
+            client = get_async_openai_client(api_key, sdk_max_retries.get())
+            response = await client.images.generate(
                 model="dall-e-3",
                 prompt=prompt,
                 size="1024x1024",
@@ -55,31 +266,401 @@ class AIProviders:
             return f"Error generating image with OpenAI: {str(e)}"
 
     @staticmethod
-    def claude_generate(api_key: str, prompt: str) -> str:
-        """Generate content using Anthropic Claude"""
+    async def claude_generate_async(api_key: str, prompt: str, model: str, max_tokens: int = 500) -> str:
+        """Generate content using Anthropic Claude without blocking the event loop"""
         try:
-            client = anthropic.Anthropic(api_key=api_key)
-            response = client.messages.create(
-                model="claude-3-sonnet-20240229",
-                max_tokens=500,
+            client = get_async_anthropic_client(api_key, sdk_max_retries.get())
+            response = await client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
                 messages=[{"role": "user", "content": prompt}]
             )
-            return response.content[0].text
+            return mark_budget_exhausted(response.content[0].text, response.stop_reason == "max_tokens")
         except Exception as e:
             return f"Error with Claude: {str(e)}"
 
     @staticmethod
-    def gemini_generate(api_key: str, prompt: str) -> str:
-        """Generate content using Google Gemini"""
+    async def gemini_generate_async(api_key: str, prompt: str, model: str, max_tokens: int = 500) -> str:
+        """Generate content using Google Gemini without blocking the event loop"""
         try:
-            genai.configure(api_key=api_key)
-            model = genai.GenerativeModel('gemini-pro')
-            response = model.generate_content(prompt)
-            return response.text
+            generative_model = get_gemini_model(api_key, model)
+            response = await generative_model.generate_content_async(
+                prompt, generation_config={"max_output_tokens": max_tokens}
+            )
+            budget_exhausted = bool(response.candidates) and response.candidates[0].finish_reason.name == "MAX_TOKENS"
+            return mark_budget_exhausted(response.text, budget_exhausted)
         except Exception as e:
             return f"Error with Gemini: {str(e)}"
 
+    @staticmethod
+    async def openai_stream(api_key: str, prompt: str, model: str, json_output: bool = False,
+                            max_tokens: int = 500) -> AsyncIterator[str]:
+        """Stream content from OpenAI GPT as tokens are generated"""
+        try:
+            client = get_async_openai_client(api_key, sdk_max_retries.get())
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=0.7,
+                response_format={"type": "json_object" if json_output else "text"},
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if chunk.choices and chunk.choices[0].finish_reason == "length":
+                    yield OUTPUT_BUDGET_EXHAUSTED
+        except Exception as e:
+            raise ProviderError(f"Error with OpenAI: {str(e)}") from e
+
+    @staticmethod
+    async def claude_stream(api_key: str, prompt: str, model: str, max_tokens: int = 500) -> AsyncIterator[str]:
+        """Stream content from Anthropic Claude as tokens are generated"""
+        try:
+            client = get_async_anthropic_client(api_key, sdk_max_retries.get())
+            async with client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                message = await stream.get_final_message()
+                if message.stop_reason == "max_tokens":
+                    yield OUTPUT_BUDGET_EXHAUSTED
+        except Exception as e:
+            raise ProviderError(f"Error with Claude: {str(e)}") from e
+
+    @staticmethod
+    async def gemini_stream(api_key: str, prompt: str, model: str, max_tokens: int = 500) -> AsyncIterator[str]:
+        """Stream content from Google Gemini as tokens are generated"""
+        try:
+            generative_model = get_gemini_model(api_key, model)
+            response = await generative_model.generate_content_async(
+                prompt, generation_config={"max_output_tokens": max_tokens}, stream=True
+            )
+            async for chunk in response:
+                yield chunk.text
+                if chunk.candidates and chunk.candidates[0].finish_reason.name == "MAX_TOKENS":
+                    yield OUTPUT_BUDGET_EXHAUSTED
+        except Exception as e:
+            raise ProviderError(f"Error with Gemini: {str(e)}") from e
+
+    @staticmethod
+    def openai_submit_batch(api_key: str, prompts: List[str], model: str, json_output: bool = False,
+                            max_tokens: int = 500) -> str:
+        """Submit many prompts to the OpenAI Batch API (cheaper, up to 24h) and return the batch id"""
+        try:
+            client = get_openai_client(api_key)
+
+            # One chat completion request per line, matched back to its prompt by custom_id
+            requests_jsonl = "\n".join(
+                json.dumps({
+                    "custom_id": f"request-{index}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": model,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": max_tokens,
+                        "temperature": 0.7,
+                        "response_format": {"type": "json_object" if json_output else "text"}
+                    }
+                })
+                for index, prompt in enumerate(prompts)
+            )
+            batch_file = client.files.create(
+                file=("batch_requests.jsonl", requests_jsonl.encode("utf-8")),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            return batch.id
+        except Exception as e:
+            return f"Error with OpenAI batch: {str(e)}"
+
+    @staticmethod
+    def openai_collect_batch(api_key: str, batch_id: str, prompt_count: int) -> Tuple[str, Optional[List[str]]]:
+        """Return an OpenAI batch's status, with one response per prompt once the batch has ended"""
+        try:
+            client = get_openai_client(api_key)
+            batch = client.batches.retrieve(batch_id)
+            if batch.status not in ("completed", "failed", "expired", "cancelled"):
+                return batch.status, None
+
+            if not batch.output_file_id:
+                return batch.status, [f"Error with OpenAI batch: batch {batch.status}"] * prompt_count
+
+            results = {}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    choice = response["body"]["choices"][0]
+                    results[record["custom_id"]] = mark_budget_exhausted(
+                        choice["message"]["content"], choice.get("finish_reason") == "length"
+                    )
+
+            return batch.status, [
+                results.get(f"request-{index}", f"Error with OpenAI batch: no result for request {index}")
+                for index in range(prompt_count)
+            ]
+        except Exception as e:
+            # The batch itself is unaffected, so the next check simply tries again
+            return f"Error checking OpenAI batch: {str(e)}", None
+
+    @staticmethod
+    def claude_submit_batch(api_key: str, prompts: List[str], model: str, max_tokens: int = 500) -> str:
+        """Submit many prompts to the Anthropic Message Batches API (cheaper, up to 24h) and return the batch id"""
+        try:
+            client = get_anthropic_client(api_key)
+            batch = client.messages.batches.create(requests=[
+                {
+                    "custom_id": f"request-{index}",
+                    "params": {
+                        "model": model,
+                        "max_tokens": max_tokens,
+                        "messages": [{"role": "user", "content": prompt}]
+                    }
+                }
+                for index, prompt in enumerate(prompts)
+            ])
+            return batch.id
+        except Exception as e:
+            return f"Error with Claude batch: {str(e)}"
+
+    @staticmethod
+    def claude_collect_batch(api_key: str, batch_id: str, prompt_count: int) -> Tuple[str, Optional[List[str]]]:
+        """Return an Anthropic batch's status, with one response per prompt once the batch has ended"""
+        try:
+            client = get_anthropic_client(api_key)
+            batch = client.messages.batches.retrieve(batch_id)
+            if batch.processing_status != "ended":
+                return batch.processing_status, None
+
+            results = {}
+            for entry in client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    message = entry.result.message
+                    results[entry.custom_id] = mark_budget_exhausted(
+                        message.content[0].text, message.stop_reason == "max_tokens"
+                    )
+
+            return batch.processing_status, [
+                results.get(f"request-{index}", f"Error with Claude batch: no result for request {index}")
+                for index in range(prompt_count)
+            ]
+        except Exception as e:
+            # The batch itself is unaffected, so the next check simply tries again
+            return f"Error checking Claude batch: {str(e)}", None
+
+
+# Coroutine used by each provider for interactive generation
+ASYNC_GENERATORS = {
+    "openai": AIProviders.openai_generate_async,
+    "claude": AIProviders.claude_generate_async,
+    "gemini": AIProviders.gemini_generate_async
+}
+
+# Streaming generator used by each provider so posts appear as they are written
+STREAM_GENERATORS = {
+    "openai": AIProviders.openai_stream,
+    "claude": AIProviders.claude_stream,
+    "gemini": AIProviders.gemini_stream
+}
 
+# Providers that offer a discounted asynchronous batch API, submitted once and collected on later reruns
+BATCH_SUBMITTERS = {
+    "openai": AIProviders.openai_submit_batch,
+    "claude": AIProviders.claude_submit_batch
+}
+
+BATCH_COLLECTORS = {
+    "openai": AIProviders.openai_collect_batch,
+    "claude": AIProviders.claude_collect_batch
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache() -> Dict[tuple, tuple]:
+    """Return the process-wide store of generated responses"""
+    return {}
+
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache_lock() -> threading.Lock:
+    """Return the lock guarding the response cache, shared by every session and the provider event loop"""
+    return threading.Lock()
+
+
+def hash_api_key(api_key: str) -> str:
+    """Hash the API key so the raw key is never kept in the response cache"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def response_cache_key(namespace: str, api_key: str, prompt: str, **options) -> tuple:
+    """Build the response cache key for a provider call"""
+    return (namespace, hash_api_key(api_key), prompt, tuple(sorted(options.items())))
+
+
+def get_cached_response(cache_key: tuple) -> Optional[str]:
+    """Return a cached response that has not yet expired"""
+    with get_response_cache_lock():
+        cached = get_response_cache().get(cache_key)
+    if cached and monotonic() - cached[0] < RESPONSE_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def store_cached_response(cache_key: tuple, content: str) -> None:
+    """Cache a successful response, evicting the oldest entry when full"""
+    # Never cache failures so the next attempt reaches the provider again
+    if content.startswith("Error"):
+        return
+
+    with get_response_cache_lock():
+        cache = get_response_cache()
+        cache.pop(cache_key, None)
+        if len(cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+            cache.pop(next(iter(cache)))
+        cache[cache_key] = (monotonic(), content)
+
+
+def evict_cached_response(cache_key: tuple) -> None:
+    """Drop a response so the next identical request reaches the provider again"""
+    with get_response_cache_lock():
+        get_response_cache().pop(cache_key, None)
+
+
+def clear_response_cache() -> None:
+    """Drop every cached response"""
+    with get_response_cache_lock():
+        get_response_cache().clear()
+
+
+async def cached_generate_async(generate_func, namespace: str, api_key: str, prompt: str, **options) -> str:
+    """Return the cached response for identical inputs, calling the provider only on a miss"""
+    cache_key = response_cache_key(namespace, api_key, prompt, **options)
+
+    content = get_cached_response(cache_key)
+    if content is None:
+        content = await generate_func(api_key, prompt, **options)
+        store_cached_response(cache_key, content)
+
+    return content
+
+
+async def cached_stream_async(stream_func, namespace: str, api_key: str, prompt: str,
+                              on_update: Callable[[str], None], **options) -> str:
+    """Stream a response through on_update as it arrives, serving identical inputs from the cache"""
+    cache_key = response_cache_key(namespace, api_key, prompt, **options)
+
+    content = get_cached_response(cache_key)
+    if content is None:
+        chunks = []
+        try:
+            async for chunk in stream_func(api_key, prompt, **options):
+                chunks.append(chunk)
+                on_update("".join(chunks))
+        except ProviderError as e:
+            # Whatever arrived before the failure is incomplete, so neither it nor the error is cached
+            return str(e)
+        content = "".join(chunks)
+        store_cached_response(cache_key, content)
+
+    return content
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_image_bytes(url: str) -> bytes:
+    """Download a generated image once so every render reuses the same bytes"""
+    response = requests.get(url, timeout=30)
+    response.raise_for_status()
+    return response.content
+
+
+def run_on_event_loop(coroutine, updates: Optional[Queue] = None,
+                      on_update: Optional[Callable[[str], None]] = None):
+    """Run a coroutine on the provider event loop and wait for its result
+
+    Streamlit elements can only be drawn from the script thread, so progress the coroutine
+    puts on ``updates`` is drained here and the latest value is passed to ``on_update``.
+    """
+    future = asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
+
+    if updates is not None:
+        while not future.done():
+            try:
+                latest = updates.get(timeout=0.1)
+            except Empty:
+                continue
+            while not updates.empty():
+                latest = updates.get_nowait()
+            on_update(latest)
+
+    return future.result()
+
+
+def run_concurrently(*coroutines, updates: Optional[Queue] = None,
+                     on_update: Optional[Callable[[str], None]] = None) -> list:
+    """Run independent provider calls concurrently and return results in order"""
+    async def gather_all():
+        return await asyncio.gather(*coroutines)
+
+    return run_on_event_loop(gather_all(), updates, on_update)
+
+
+def is_rate_limited(content: str) -> bool:
+    """Check whether a provider error string reports an HTTP 429 rate limit"""
+    return content.startswith("Error") and ("429" in content or "rate limit" in content.lower())
+
+
+def run_rate_limited(calls: List[Callable[[], Awaitable[str]]], max_concurrency: int, rpm_limit: int) -> List[str]:
+    """Run many provider calls within a concurrency cap and a requests-per-minute budget
+
+    Request starts are spaced evenly to stay under the RPM limit, and calls rejected with
+    a 429 are retried with exponential backoff. Results are returned in call order.
+    """
+    async def run_all():
+        # Tasks copy this context, so each call's client leaves 429 retries to tenacity below
+        sdk_max_retries.set(0)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pacing_lock = asyncio.Lock()
+        start_interval = 60 / rpm_limit
+        next_start = 0.0
+
+        async def paced_call(call):
+            nonlocal next_start
+            async with pacing_lock:
+                now = asyncio.get_running_loop().time()
+                delay = max(0.0, next_start - now)
+                next_start = max(now, next_start) + start_interval
+            await asyncio.sleep(delay)
+            return await call()
+
+        async def bounded_call(call):
+            async with semaphore:
+                retrying = AsyncRetrying(
+                    retry=retry_if_result(is_rate_limited),
+                    wait=wait_exponential(multiplier=1, max=60),
+                    stop=stop_after_attempt(RATE_LIMIT_MAX_ATTEMPTS),
+                    retry_error_callback=lambda retry_state: retry_state.outcome.result()
+                )
+                return await retrying(paced_call, call)
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(bounded_call(call)) for call in calls]
+
+        return [task.result() for task in tasks]
+
+    return run_on_event_loop(run_all())
+
+
+@st.cache_data(show_spinner=False)
 def create_image_prompt(event_name: str, event_description: str, venue: str) -> str:
     """Create prompt for image generation"""
     prompt = f"""
@@ -95,72 +676,323 @@ def create_image_prompt(event_name: str, event_description: str, venue: str) ->
     return prompt
 
 
-def create_prompt(event_name: str, event_description: str, tone: str, platform: str,
-                  event_date: str, event_time: str, venue: str) -> str:
-    """Create platform-specific prompts with event details"""
-
-    platform_specs = {
-        "LinkedIn": {
-            "limit": "700 characters",
-            "style": "professional networking post with business language",
-            "features": "Include relevant hashtags, professional call-to-action, and networking angle"
-        },
-        "Twitter": {
-            "limit": "280 characters",
-            "style": "concise and engaging tweet",
-            "features": "Include relevant hashtags, mentions, and compelling hook"
-        },
-        "WhatsApp": {
-            "limit": "500 characters",
-            "style": "casual and personal message",
-            "features": "Use emojis, friendly tone, and personal invitation style"
-        }
+@st.cache_data(show_spinner=False)
+def create_multi_platform_prompt(event_name: str, event_description: str, tone: str,
+                                 event_date: str, event_time: str, venue: str) -> str:
+    """Create a single prompt that asks for every platform's post as one JSON object"""
+    return MULTI_PLATFORM_PROMPT_TEMPLATE.format(
+        event_name=event_name,
+        event_description=event_description,
+        event_date=event_date,
+        event_time=event_time,
+        venue=venue,
+        tone=tone
+    )
+
+
+def parse_multi_platform_response(content: str) -> Dict[str, str]:
+    """Split a combined JSON response into per-platform posts"""
+    if content.startswith("Error"):
+        return {platform: content for platform in PLATFORMS}
+
+    content, budget_exhausted = split_budget_exhausted(content)
+    missing_post = (
+        "Error: output budget exhausted before the {platform} post was finished" if budget_exhausted
+        else "Error parsing {platform} post from response"
+    )
+
+    try:
+        posts = json.loads(content)
+    except json.JSONDecodeError:
+        # Providers without a JSON mode may wrap the object in prose or code fences
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        try:
+            posts = json.loads(match.group(0)) if match else {}
+        except json.JSONDecodeError:
+            posts = {}
+
+        # A response cut off by the token budget still holds every post that was finished
+        if not posts:
+            posts = parse_partial_posts(content, completed_only=True)
+
+    if not isinstance(posts, dict):
+        posts = {}
+
+    return {
+        platform: str(posts[platform]) if posts.get(platform) else missing_post.format(platform=platform)
+        for platform in PLATFORMS
     }
 
-    spec = platform_specs[platform]
 
-    prompt = f"""
-    Create a {platform} post about the following event:
+def parse_cached_response(content: str, cache_key: tuple) -> Dict[str, str]:
+    """Split a combined response into per-platform posts, evicting it from the cache if unparseable"""
+    posts = parse_multi_platform_response(content)
 
-    Event Name: {event_name}
-    Event Description: {event_description}
-    Date: {event_date}
-    Time: {event_time}
-    Venue: {venue}
-    Tone: {tone}
+    # An unparseable response must not be served from the cache again; one cut off at the token
+    # budget is kept, since asking again with the same budget would pay for the same cut-off
+    _, budget_exhausted = split_budget_exhausted(content)
+    if (not content.startswith("Error") and not budget_exhausted
+            and any(post.startswith("Error") for post in posts.values())):
+        evict_cached_response(cache_key)
+
+    return posts
 
-    Requirements:
-    - Maximum {spec['limit']}
-    - Style: {spec['style']}
-    - {spec['features']}
-    - Tone should be {tone}
-    - MUST include date, time, and venue information
-    - Make it engaging and action-oriented
 
-    Generate only the post content, no additional explanation.
+def parse_partial_posts(content: str, completed_only: bool = False) -> Dict[str, str]:
+    """Extract each platform's post text so far from a partially streamed JSON response
+
+    With completed_only, posts whose closing quote has not arrived are left out.
     """
+    content, _ = split_budget_exhausted(content)
+    posts = {}
+    for platform in PLATFORMS:
+        closing_quote = '"' if completed_only else ""
+        match = re.search(rf'"{platform}"\s*:\s*"((?:[^"\\]|\\.)*){closing_quote}', content)
+        if not match:
+            continue
+
+        # Drop a unicode escape that has only partially arrived, and a high surrogate still awaiting its pair
+        raw = re.sub(r"\\u[0-9a-fA-F]{0,3}$", "", match.group(1))
+        raw = re.sub(r"\\u[dD][89abAB][0-9a-fA-F]{2}$", "", raw)
+        try:
+            posts[platform] = json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            continue
+
+    return posts
+
+
+def load_bulk_events(uploaded_file) -> List[Dict[str, str]]:
+    """Read events from an uploaded CSV with event_name, description, date, time and venue columns"""
+    reader = csv.DictReader(StringIO(uploaded_file.getvalue().decode("utf-8-sig")))
+    return [
+        {column: (row.get(column) or "").strip() for column in BULK_EVENT_COLUMNS}
+        for row in reader
+        if (row.get("event_name") or "").strip()
+    ]
+
+
+def create_bulk_prompts(tone: str, events: List[Dict[str, str]]) -> List[str]:
+    """Build the combined multi-platform prompt for each bulk event"""
+    return [
+        create_multi_platform_prompt(
+            event["event_name"],
+            event["description"],
+            tone,
+            event["date"],
+            event["time"],
+            event["venue"]
+        )
+        for event in events
+    ]
+
+
+def bulk_generate_options(provider_key: str, model_tier: str) -> Dict:
+    """Return the provider options shared by every bulk request"""
+    generate_options = {"model": MODEL_TIERS[model_tier][provider_key], "max_tokens": MULTI_PLATFORM_MAX_TOKENS}
+    if provider_key == "openai":
+        generate_options["json_output"] = True
+    return generate_options
+
+
+def generate_bulk_posts(provider_key: str, api_key: str, tone: str, events: List[Dict[str, str]],
+                        model_tier: str = "Fast", max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                        rpm_limit: int = DEFAULT_RPM_LIMIT) -> List[Dict[str, str]]:
+    """Generate every platform's post for each event concurrently, within the rate limits"""
+    prompts = create_bulk_prompts(tone, events)
+    generate_options = bulk_generate_options(provider_key, model_tier)
+
+    responses = run_rate_limited(
+        [
+            partial(cached_generate_async, ASYNC_GENERATORS[provider_key], provider_key, api_key, prompt,
+                    **generate_options)
+            for prompt in prompts
+        ],
+        max_concurrency,
+        rpm_limit
+    )
 
-    return prompt
+    return [
+        parse_cached_response(response, response_cache_key(provider_key, api_key, prompt, **generate_options))
+        for prompt, response in zip(prompts, responses)
+    ]
+
+
+def submit_bulk_batch(provider_key: str, api_key: str, tone: str, events: List[Dict[str, str]],
+                      model_tier: str = "Fast") -> Dict:
+    """Submit every event to the provider's batch API, returning what is needed to collect it later"""
+    prompts = create_bulk_prompts(tone, events)
+    batch_id = BATCH_SUBMITTERS[provider_key](api_key, prompts, **bulk_generate_options(provider_key, model_tier))
+    return {"provider_key": provider_key, "batch_id": batch_id, "events": events, "prompts": prompts}
 
 
+def bulk_posts_to_csv(events: List[Dict[str, str]], bulk_posts: List[Dict[str, str]]) -> str:
+    """Serialize bulk generation results to CSV, one row per event"""
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(BULK_EVENT_COLUMNS + PLATFORMS)
+    for event, posts in zip(events, bulk_posts):
+        writer.writerow([event[column] for column in BULK_EVENT_COLUMNS] + [posts[platform] for platform in PLATFORMS])
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False)
 def format_datetime_display(event_date, event_time):
     """Format date and time for display"""
-    try:
-        # Format date
-        if isinstance(event_date, date):
-            formatted_date = event_date.strftime("%B %d, %Y")
-        else:
-            formatted_date = str(event_date)
+    formatted_date = event_date.strftime("%B %d, %Y") if isinstance(event_date, date) else str(event_date)
+    formatted_time = event_time.strftime("%I:%M %p") if isinstance(event_time, time) else str(event_time)
+    return f"{formatted_date} at {formatted_time}"
+
+
+def render_copy_button(platform: str, content: str) -> None:
+    """Render a button that copies the post in the browser, without a round-trip to the server"""
+    components.html(
+        f"""
+        <button onclick="navigator.clipboard.writeText({html.escape(json.dumps(content))})
+                         .then(() => this.innerText = '✅ Copied!')"
+                style="width: 100%; padding: 0.4rem; border: 1px solid #ccc; border-radius: 0.5rem;
+                       background: white; cursor: pointer; font-family: sans-serif;">
+            📋 Copy {html.escape(platform)} Post
+        </button>
+        """,
+        height=45
+    )
 
-        # Format time
-        if isinstance(event_time, time):
-            formatted_time = event_time.strftime("%I:%M %p")
+
+@st.fragment
+def render_results(event: Dict[str, str], posts: Dict[str, str], image_url: Optional[str]) -> None:
+    """Render the generated posts, image and resources for a single event
+
+    Runs as a fragment so widgets inside the results only rerun this pane, not the whole app.
+    """
+    # Download the image once; every st.image below reuses the same bytes
+    image_bytes = None
+    if image_url:
+        if image_url.startswith("Error"):
+            st.warning(f"Image generation failed: {image_url}")
         else:
-            formatted_time = str(event_time)
+            try:
+                image_bytes = fetch_image_bytes(image_url)
+            except requests.RequestException as e:
+                st.warning(f"Image download failed: {str(e)}")
+
+    if image_bytes:
+        st.subheader("🎨 Generated Event Image")
+        st.image(image_bytes, caption="AI Generated Event Image", use_container_width=True)
+        st.download_button(
+            "⬇️ Download Image",
+            data=image_bytes,
+            file_name="event_image.png",
+            mime="image/png"
+        )
+
+    # Render posts for each platform
+    for platform, content in posts.items():
+        with st.expander(f"📊 {platform} Post", expanded=True):
+            # Display event summary
+            st.write("**📅 Event Summary:**")
+            st.info(f"**{event['name']}**\n📅 {event['datetime']}\n📍 {event['venue']}")
+
+            # Display the generated post
+            st.write("**Generated Post:**")
+            st.success(content)
+
+            # Character count
+            char_count = len(content)
+
+            # Platform-specific limits
+            limit = LIMITS[platform]
+
+            if char_count <= limit:
+                st.success(f"✅ Character count: {char_count}/{limit}")
+            else:
+                st.warning(f"⚠️ Character count: {char_count}/{limit} (exceeds limit)")
+
+            # Show image for this platform if available
+            if image_bytes:
+                st.write("**🖼️ Suggested Image:**")
+                st.image(image_bytes, width=300)
+
+            # Additional options
+            col_copy, col_edit = st.columns(2)
+
+            with col_copy:
+                render_copy_button(platform, content)
+
+            with col_edit:
+                if st.button(f"✏️ Edit {platform} Post", key=f"edit_{platform}"):
+                    st.info("Click to customize this post further...")
+
+    # Additional resources section
+    st.subheader("📚 Additional Resources")
+
+    col_res1, col_res2 = st.columns(2)
+
+    with col_res1:
+        st.write("**📋 Event Details Summary:**")
+        summary_text = f"""
+**Event:** {event['name']}
+**Date:** {event['datetime']}
+**Venue:** {event['venue']}
+**Description:** {event['description'][:100]}...
+        """
+        st.code(summary_text)
+
+    with col_res2:
+        st.write("**💡 Tips for Better Engagement:**")
+        tips = [
+            "Post at optimal times for each platform",
+            "Use platform-specific hashtags",
+            "Engage with comments promptly",
+            "Share behind-the-scenes content",
+            "Create countdown posts leading to the event"
+        ]
+        for tip in tips:
+            st.write(f"• {tip}")
+
+
+def render_bulk_results(events: List[Dict[str, str]], bulk_posts: List[Dict[str, str]]) -> None:
+    """Display every event's generated posts with a CSV download of the whole batch"""
+    for event, posts in zip(events, bulk_posts):
+        with st.expander(f"📅 {event['event_name']}"):
+            for platform, content in posts.items():
+                st.write(f"**{platform} Post:**")
+                st.success(content)
+
+    st.download_button(
+        "⬇️ Download All Posts (CSV)",
+        data=bulk_posts_to_csv(events, bulk_posts),
+        file_name="social_media_posts.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
 
-        return f"{formatted_date} at {formatted_time}"
-    except:
-        return f"{event_date} at {event_time}"
+
+@st.fragment(run_every=BATCH_POLL_INTERVAL)
+def render_pending_batch(api_key: str) -> None:
+    """Check a submitted bulk batch on a timer, keeping its results once the batch has ended"""
+    pending_batch = st.session_state.get("pending_batch")
+    if pending_batch is None:
+        return
+
+    status, responses = BATCH_COLLECTORS[pending_batch["provider_key"]](
+        api_key, pending_batch["batch_id"], len(pending_batch["prompts"])
+    )
+    if responses is None:
+        st.info(
+            f"⏳ Batch `{pending_batch['batch_id']}` status: {status}. "
+            "Results appear here once it finishes; the app stays usable meanwhile."
+        )
+        return
+
+    st.session_state["bulk_generated"] = {
+        "inputs_hash": pending_batch["inputs_hash"],
+        "events": pending_batch["events"],
+        "posts": [parse_multi_platform_response(response) for response in responses]
+    }
+    st.session_state.pop("pending_batch")
+    st.session_state.pop("generated", None)
+    st.rerun()
 
 
 def main():
@@ -172,15 +1004,9 @@ def main():
         st.header("⚙️ Configuration")
 
         # AI Provider selection
-        ai_providers = {
-            "OpenAI (GPT + DALL-E)": "openai",
-            "Anthropic (Claude)": "claude",
-            "Google (Gemini)": "gemini"
-        }
-
         selected_provider = st.selectbox(
             "Select AI Provider:",
-            options=list(ai_providers.keys()),
+            options=list(AI_PROVIDERS.keys()),
             help="Choose your preferred AI provider. OpenAI includes image generation."
         )
 
@@ -192,23 +1018,19 @@ def main():
         )
 
         # Tone selection
-        tones = [
-            "Professional",
-            "Casual",
-            "Enthusiastic",
-            "Sarcastic",
-            "Humorous",
-            "Inspirational",
-            "Urgent",
-            "Friendly"
-        ]
-
         selected_tone = st.selectbox(
             "Select Tone:",
-            options=tones,
+            options=TONES,
             help="Choose the tone for your posts"
         )
 
+        # Model tier selection
+        model_tier = st.selectbox(
+            "Speed tier:",
+            options=list(MODEL_TIERS.keys()),
+            help="Fast uses mini/haiku/flash models; Quality uses the larger models of the selected provider"
+        )
+
         # Image generation option
         generate_images = st.checkbox(
             "Generate Images (OpenAI only)",
@@ -216,6 +1038,37 @@ def main():
             help="Generate relevant images for posts (requires OpenAI API)"
         )
 
+        # Batch mode trades latency for cost on bulk generation
+        batch_mode = st.toggle(
+            "Batch mode (cheaper, ~24h)",
+            value=False,
+            help="Submit bulk events through the provider's batch API (OpenAI and Anthropic only)"
+        )
+
+        # Pacing for bulk generation outside batch mode
+        with st.expander("⚡ Bulk Rate Limits"):
+            max_concurrency = st.number_input(
+                "Max concurrency:",
+                min_value=1,
+                max_value=HTTP_POOL_LIMITS.max_connections,
+                value=DEFAULT_MAX_CONCURRENCY,
+                help="Maximum number of provider requests in flight at once, up to the connection pool size"
+            )
+
+            rpm_limit = st.number_input(
+                "RPM limit:",
+                min_value=1,
+                max_value=10000,
+                value=DEFAULT_RPM_LIMIT,
+                help="Maximum requests per minute sent to the provider"
+            )
+
+        # Cached responses are reused for identical inputs until cleared
+        if st.button("🗑️ Clear cache", help="Discard cached posts and images to force regeneration"):
+            clear_response_cache()
+            fetch_image_bytes.clear()
+            st.success("Cache cleared!")
+
     # Main content area
     col1, col2 = st.columns([1, 2])
 
@@ -233,19 +1086,19 @@ def main():
             placeholder="Describe your event in detail..."
         )
 
-        # Date and Time inputs
+        # Date and Time inputs; symbolic defaults stay the same across reruns, unlike datetime.now()
         col_date, col_time = st.columns(2)
 
         with col_date:
             event_date = st.date_input(
                 "Event Date:",
-                value=datetime.now().date()
+                value="today"
             )
 
         with col_time:
             event_time = st.time_input(
                 "Event Time:",
-                value=datetime.now().time()
+                value="now"
             )
 
         venue = st.text_input(
@@ -271,6 +1124,44 @@ def main():
             use_container_width=True
         )
 
+        # Bulk generation from a CSV of events
+        with st.expander("📂 Bulk Events (CSV)"):
+            bulk_file = st.file_uploader(
+                "Events CSV:",
+                type="csv",
+                help=f"Columns: {', '.join(BULK_EVENT_COLUMNS)}"
+            )
+
+            bulk_button = st.button(
+                "📦 Generate Bulk Posts",
+                use_container_width=True,
+                disabled=bulk_file is None
+            )
+
+    # Identify the current inputs so previously generated results can be reused
+    inputs_hash = hashlib.sha1(json.dumps([
+        selected_provider,
+        model_tier,
+        selected_tone,
+        generate_images,
+        event_name,
+        event_description,
+        str(event_date),
+        str(event_time),
+        venue
+    ]).encode()).hexdigest()
+    generated = st.session_state.get("generated", {})
+
+    # Bulk results depend on the uploaded file rather than the single-event inputs
+    bulk_inputs_hash = hashlib.sha1(json.dumps([
+        selected_provider,
+        model_tier,
+        selected_tone,
+        batch_mode,
+        hashlib.sha1(bulk_file.getvalue()).hexdigest() if bulk_file is not None else None
+    ]).encode()).hexdigest()
+    bulk_generated = st.session_state.get("bulk_generated", {})
+
     with col2:
         st.header("📱 Generated Content")
 
@@ -281,112 +1172,138 @@ def main():
                 st.error("Please enter your API key.")
             else:
                 # Get the provider function
-                provider_key = ai_providers[selected_provider]
-
-                if provider_key == "openai":
-                    generate_func = AIProviders.openai_generate
-                elif provider_key == "claude":
-                    generate_func = AIProviders.claude_generate
-                elif provider_key == "gemini":
-                    generate_func = AIProviders.gemini_generate
+                provider_key = AI_PROVIDERS[selected_provider]
+                stream_func = STREAM_GENERATORS[provider_key]
 
                 # Format datetime for display
                 datetime_str = format_datetime_display(event_date, event_time)
 
-                # Generate image if OpenAI is selected and option is enabled
-                generated_image_url = None
-                if generate_images and provider_key == "openai":
-                    with st.spinner("Generating event image..."):
-                        image_prompt = create_image_prompt(event_name, event_description, venue)
-                        generated_image_url = AIProviders.openai_generate_image(api_key, image_prompt)
-
-                        if not generated_image_url.startswith("Error"):
-                            st.subheader("🎨 Generated Event Image")
-                            st.image(generated_image_url, caption="AI Generated Event Image", use_container_width=True)
-                        else:
-                            st.warning(f"Image generation failed: {generated_image_url}")
-
-                # Generate posts for each platform
-                platforms = ["LinkedIn", "Twitter", "WhatsApp"]
-
-                with st.spinner("Generating posts..."):
-                    for platform in platforms:
-                        with st.expander(f"📊 {platform} Post", expanded=True):
-                            prompt = create_prompt(
-                                event_name,
-                                event_description,
+                # Request every platform's post in one call; OpenAI can guarantee JSON output
+                generate_options = {
+                    "model": MODEL_TIERS[model_tier][provider_key],
+                    "max_tokens": MULTI_PLATFORM_MAX_TOKENS
+                }
+                if provider_key == "openai":
+                    generate_options["json_output"] = True
+                prompt = create_multi_platform_prompt(
+                    event_name,
+                    event_description,
+                    selected_tone.lower(),
+                    datetime_str,
+                    str(event_time),
+                    venue
+                )
+
+                # Show each platform's post as its tokens stream in
+                stream_placeholders = {platform: st.empty() for platform in PLATFORMS}
+
+                def show_partial_posts(content: str) -> None:
+                    for platform, partial_post in parse_partial_posts(content).items():
+                        stream_placeholders[platform].success(f"**{platform}:** {partial_post}")
+
+                # Partial responses are queued by the event loop and drawn from this thread
+                stream_updates = Queue()
+                tasks = [cached_stream_async(
+                    stream_func, provider_key, api_key, prompt, stream_updates.put, **generate_options
+                )]
+
+                # Generate image alongside the posts if OpenAI is selected and option is enabled
+                with_image = generate_images and provider_key == "openai"
+                if with_image:
+                    image_prompt = create_image_prompt(event_name, event_description, venue)
+                    tasks.append(cached_generate_async(
+                        AIProviders.openai_generate_image_async, "openai_image", api_key, image_prompt
+                    ))
+
+                spinner_text = "Generating posts and event image..." if with_image else "Generating posts..."
+                with st.spinner(spinner_text):
+                    results = run_concurrently(*tasks, updates=stream_updates, on_update=show_partial_posts)
+
+                for placeholder in stream_placeholders.values():
+                    placeholder.empty()
+
+                posts = parse_cached_response(
+                    results[0], response_cache_key(provider_key, api_key, prompt, **generate_options)
+                )
+                generated_image_url = results[1] if with_image else None
+
+                # Keep the results so reruns triggered by other widgets can redisplay them for free
+                st.session_state["generated"] = {
+                    "inputs_hash": inputs_hash,
+                    "event": {
+                        "name": event_name,
+                        "description": event_description,
+                        "datetime": datetime_str,
+                        "venue": venue
+                    },
+                    "posts": posts,
+                    "image_url": generated_image_url
+                }
+                st.session_state.pop("bulk_generated", None)
+                generated = st.session_state["generated"]
+                render_results(generated["event"], generated["posts"], generated["image_url"])
+
+        elif bulk_button:
+            events = load_bulk_events(bulk_file)
+
+            if not events:
+                st.error("No events found in the uploaded CSV.")
+            elif not api_key:
+                st.error("Please enter your API key.")
+            else:
+                provider_key = AI_PROVIDERS[selected_provider]
+
+                if batch_mode and provider_key not in BATCH_SUBMITTERS:
+                    st.info(f"Batch mode is not available for {selected_provider}; generating concurrently instead.")
+
+                if batch_mode and provider_key in BATCH_SUBMITTERS:
+                    if "pending_batch" in st.session_state:
+                        st.warning("A batch is already running; wait for its results before submitting another.")
+                    else:
+                        with st.spinner(f"Submitting {len(events)} events as a batch..."):
+                            pending_batch = submit_bulk_batch(
+                                provider_key,
+                                api_key,
                                 selected_tone.lower(),
-                                platform,
-                                datetime_str,
-                                str(event_time),
-                                venue
+                                events,
+                                model_tier=model_tier
                             )
 
-                            # Generate content
-                            content = generate_func(api_key, prompt)
-
-                            # Display event summary
-                            st.write("**📅 Event Summary:**")
-                            st.info(f"**{event_name}**\n📅 {datetime_str}\n📍 {venue}")
-
-                            # Display the generated post
-                            st.write("**Generated Post:**")
-                            st.success(content)
-
-                            # Character count
-                            char_count = len(content)
-
-                            # Platform-specific limits
-                            limits = {"LinkedIn": 700, "Twitter": 280, "WhatsApp": 500}
-                            limit = limits[platform]
-
-                            if char_count <= limit:
-                                st.success(f"✅ Character count: {char_count}/{limit}")
-                            else:
-                                st.warning(f"⚠️ Character count: {char_count}/{limit} (exceeds limit)")
-
-                            # Show image for this platform if available
-                            if generated_image_url and not generated_image_url.startswith("Error"):
-                                st.write("**🖼️ Suggested Image:**")
-                                st.image(generated_image_url, width=300)
-
-                            # Additional options
-                            col_copy, col_edit = st.columns(2)
-
-                            with col_copy:
-                                if st.button(f"📋 Copy {platform} Post", key=f"copy_{platform}"):
-                                    st.success(f"{platform} post ready to copy!")
-
-                            with col_edit:
-                                if st.button(f"✏️ Edit {platform} Post", key=f"edit_{platform}"):
-                                    st.info("Click to customize this post further...")
-
-                # Additional resources section
-                st.subheader("📚 Additional Resources")
-
-                col_res1, col_res2 = st.columns(2)
-
-                with col_res1:
-                    st.write("**📋 Event Details Summary:**")
-                    summary_text = f"""
-**Event:** {event_name}
-**Date:** {datetime_str}
-**Venue:** {venue}
-**Description:** {event_description[:100]}...
-                    """
-                    st.code(summary_text)
-
-                with col_res2:
-                    st.write("**💡 Tips for Better Engagement:**")
-                    tips = [
-                        "Post at optimal times for each platform",
-                        "Use platform-specific hashtags",
-                        "Engage with comments promptly",
-                        "Share behind-the-scenes content",
-                        "Create countdown posts leading to the event"
-                    ]
-                    for tip in tips:
-                        st.write(f"• {tip}")
+                        if pending_batch["batch_id"].startswith("Error"):
+                            st.error(pending_batch["batch_id"])
+                        else:
+                            # The batch runs for up to 24h, so it is checked on later reruns instead of waited on
+                            pending_batch["inputs_hash"] = bulk_inputs_hash
+                            st.session_state["pending_batch"] = pending_batch
+                else:
+                    with st.spinner(f"Generating posts for {len(events)} events..."):
+                        bulk_posts = generate_bulk_posts(
+                            provider_key,
+                            api_key,
+                            selected_tone.lower(),
+                            events,
+                            model_tier=model_tier,
+                            max_concurrency=max_concurrency,
+                            rpm_limit=rpm_limit
+                        )
+
+                    # Keep the results so the download click and other reruns can redisplay them
+                    st.session_state["bulk_generated"] = {
+                        "inputs_hash": bulk_inputs_hash,
+                        "events": events,
+                        "posts": bulk_posts
+                    }
+                    st.session_state.pop("generated", None)
+                    render_bulk_results(events, bulk_posts)
+
+        elif generated.get("inputs_hash") == inputs_hash:
+            render_results(generated["event"], generated["posts"], generated["image_url"])
+
+        elif bulk_generated.get("inputs_hash") == bulk_inputs_hash:
+            render_bulk_results(bulk_generated["events"], bulk_generated["posts"])
+
+        if "pending_batch" in st.session_state:
+            render_pending_batch(api_key)
 
     # Footer
     st.markdown("---")
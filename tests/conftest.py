@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The app is a single top-level script, so make it importable for the unit tests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
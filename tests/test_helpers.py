@@ -0,0 +1,156 @@
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from tenacity import wait_none
+
+import SocialMediaEventGenerator as app
+
+POSTS = {
+    "LinkedIn": "Join us at the Annual Tech Conference.",
+    "Twitter": "Tech Conference this week! #tech",
+    "WhatsApp": "Hey! Come to the Tech Conference 🎉",
+}
+
+
+def test_parse_multi_platform_response_reads_plain_json():
+    assert app.parse_multi_platform_response(json.dumps(POSTS)) == POSTS
+
+
+def test_parse_multi_platform_response_strips_prose_and_code_fences():
+    content = f"Here are your posts:\n```json\n{json.dumps(POSTS)}\n```"
+    assert app.parse_multi_platform_response(content) == POSTS
+
+
+def test_parse_multi_platform_response_keeps_finished_posts_of_truncated_response():
+    content = '{"LinkedIn": "Join us", "Twitter": "See you", "WhatsApp": "Hey'
+    assert app.parse_multi_platform_response(content) == {
+        "LinkedIn": "Join us",
+        "Twitter": "See you",
+        "WhatsApp": "Error parsing WhatsApp post from response",
+    }
+
+
+def test_parse_multi_platform_response_reports_exhausted_budget():
+    content = '{"LinkedIn": "Join us", "Twitter": "See you", "WhatsApp": "Hey' + app.OUTPUT_BUDGET_EXHAUSTED
+    posts = app.parse_multi_platform_response(content)
+    assert posts["Twitter"] == "See you"
+    assert posts["WhatsApp"] == "Error: output budget exhausted before the WhatsApp post was finished"
+
+
+def test_parse_multi_platform_response_passes_provider_errors_through():
+    error = "Error with OpenAI: invalid key"
+    assert app.parse_multi_platform_response(error) == {platform: error for platform in app.PLATFORMS}
+
+
+def test_parse_partial_posts_trims_partial_unicode_escape():
+    assert app.parse_partial_posts('{"LinkedIn": "Caf\\u00') == {"LinkedIn": "Caf"}
+
+
+def test_parse_partial_posts_holds_back_high_surrogate_until_its_pair_arrives():
+    assert app.parse_partial_posts('{"LinkedIn": "Party \\ud83c') == {"LinkedIn": "Party "}
+    assert app.parse_partial_posts('{"LinkedIn": "Party \\ud83c\\udf89') == {"LinkedIn": "Party 🎉"}
+
+
+def test_parse_partial_posts_completed_only_leaves_out_open_posts():
+    content = '{"LinkedIn": "Join \\"us\\"", "Twitter": "See y'
+    assert app.parse_partial_posts(content) == {"LinkedIn": 'Join "us"', "Twitter": "See y"}
+    assert app.parse_partial_posts(content, completed_only=True) == {"LinkedIn": 'Join "us"'}
+
+
+def test_parse_partial_posts_ignores_budget_tag():
+    content = '{"LinkedIn": "Join us' + app.OUTPUT_BUDGET_EXHAUSTED
+    assert app.parse_partial_posts(content) == {"LinkedIn": "Join us"}
+
+
+def rate_limited_calls(*responses):
+    """Build a call for each list of responses, returned one per attempt, recording attempts"""
+    attempts = []
+
+    def make_call(index, results):
+        async def call():
+            attempts.append(index)
+            return results.pop(0)
+        return call
+
+    return [make_call(index, list(results)) for index, results in enumerate(responses)], attempts
+
+
+def test_run_rate_limited_returns_results_in_call_order():
+    calls, _ = rate_limited_calls(["first"], ["second"], ["third"])
+    assert app.run_rate_limited(calls, max_concurrency=2, rpm_limit=6000) == ["first", "second", "third"]
+
+
+def test_run_rate_limited_retries_429():
+    calls, attempts = rate_limited_calls(["Error with OpenAI: 429 Too Many Requests", "posted"])
+    with mock.patch.object(app, "wait_exponential", lambda **kwargs: wait_none()):
+        assert app.run_rate_limited(calls, max_concurrency=1, rpm_limit=6000) == ["posted"]
+    assert attempts == [0, 0]
+
+
+def test_run_rate_limited_returns_last_error_after_max_attempts():
+    errors = [f"Error with Claude: rate limit exceeded ({attempt})" for attempt in range(app.RATE_LIMIT_MAX_ATTEMPTS)]
+    calls, attempts = rate_limited_calls(errors)
+    with mock.patch.object(app, "wait_exponential", lambda **kwargs: wait_none()):
+        assert app.run_rate_limited(calls, max_concurrency=1, rpm_limit=6000) == [errors[-1]]
+    assert len(attempts) == app.RATE_LIMIT_MAX_ATTEMPTS
+
+
+def test_openai_batch_results_are_matched_by_custom_id():
+    submitted = {}
+
+    def create_file(file, purpose):
+        submitted["lines"] = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file-input")
+
+    def output_line(index, content):
+        body = {"choices": [{"message": {"content": content}, "finish_reason": "stop"}]}
+        return json.dumps({"custom_id": f"request-{index}", "response": {"status_code": 200, "body": body}})
+
+    client = SimpleNamespace(
+        files=SimpleNamespace(
+            create=create_file,
+            # Results arrive out of order, and the second request has none
+            content=lambda file_id: SimpleNamespace(text=f"{output_line(2, 'third')}\n{output_line(0, 'first')}")
+        ),
+        batches=SimpleNamespace(
+            create=lambda **kwargs: SimpleNamespace(id="batch-1"),
+            retrieve=lambda batch_id: SimpleNamespace(status="completed", output_file_id="file-output")
+        )
+    )
+
+    with mock.patch.object(app, "get_openai_client", lambda api_key: client):
+        assert app.AIProviders.openai_submit_batch("sk-test", ["a", "b", "c"], model="gpt-4o-mini") == "batch-1"
+        status, responses = app.AIProviders.openai_collect_batch("sk-test", "batch-1", 3)
+
+    assert [line["custom_id"] for line in submitted["lines"]] == ["request-0", "request-1", "request-2"]
+    assert [line["body"]["messages"][0]["content"] for line in submitted["lines"]] == ["a", "b", "c"]
+    assert status == "completed"
+    assert responses == ["first", "Error with OpenAI batch: no result for request 1", "third"]
+
+
+def test_claude_batch_results_are_matched_by_custom_id():
+    def entry(index, text):
+        message = SimpleNamespace(content=[SimpleNamespace(text=text)], stop_reason="end_turn")
+        return SimpleNamespace(custom_id=f"request-{index}", result=SimpleNamespace(type="succeeded", message=message))
+
+    batches = SimpleNamespace(
+        retrieve=lambda batch_id: SimpleNamespace(processing_status="ended"),
+        results=lambda batch_id: [entry(1, "second"), entry(0, "first")]
+    )
+    client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+
+    with mock.patch.object(app, "get_anthropic_client", lambda api_key: client):
+        status, responses = app.AIProviders.claude_collect_batch("sk-test", "batch-1", 3)
+
+    assert status == "ended"
+    assert responses == ["first", "second", "Error with Claude batch: no result for request 2"]
+
+
+def test_unfinished_batch_is_left_to_a_later_check():
+    client = SimpleNamespace(batches=SimpleNamespace(
+        retrieve=lambda batch_id: SimpleNamespace(status="in_progress", output_file_id=None)
+    ))
+
+    with mock.patch.object(app, "get_openai_client", lambda api_key: client):
+        assert app.AIProviders.openai_collect_batch("sk-test", "batch-1", 3) == ("in_progress", None)
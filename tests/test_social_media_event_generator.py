@@ -0,0 +1,125 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP_PATH = str(Path(__file__).resolve().parent.parent / "SocialMediaEventGenerator.py")
+
+POSTS = {
+    "LinkedIn": "Join us at the Annual Tech Conference.",
+    "Twitter": "Tech Conference this week! #tech",
+    "WhatsApp": "Hey! Come to the Tech Conference 🎉",
+}
+
+
+class FakeStream:
+    """Async iterator over chat completion chunks carrying the given text"""
+
+    def __init__(self, text):
+        self.chunks = iter(text[i:i + 16] for i in range(0, len(text), 16))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            content = next(self.chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=None)])
+
+
+class FakeAsyncOpenAI:
+    """Stand-in for openai.AsyncOpenAI that streams a fixed multi-platform response"""
+
+    calls = 0
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        FakeAsyncOpenAI.calls += 1
+        return FakeStream(json.dumps(POSTS))
+
+
+@pytest.fixture
+def app():
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    FakeAsyncOpenAI.calls = 0
+    with mock.patch("openai.AsyncOpenAI", FakeAsyncOpenAI):
+        yield AppTest.from_file(APP_PATH, default_timeout=30).run()
+
+
+def by_label(widgets, label):
+    return next(widget for widget in widgets if widget.label == label)
+
+
+def shown_posts(at):
+    return [element.value for element in at.success if element.value in POSTS.values()]
+
+
+def test_results_survive_unrelated_rerun(app):
+    by_label(app.text_input, "API Key:").input("sk-test")
+    by_label(app.text_input, "Event Name:").input("Annual Tech Conference")
+    by_label(app.text_area, "Event Description:").input("A day of talks")
+    by_label(app.text_input, "Venue:").input("Convention Center")
+    by_label(app.checkbox, "Generate Images (OpenAI only)").uncheck()
+    app.run()
+
+    by_label(app.button, "🚀 Generate Posts & Images").click().run()
+    assert not app.exception
+    assert shown_posts(app) == list(POSTS.values())
+
+    # Editing a field the posts do not depend on reruns the script without regenerating
+    by_label(app.text_input, "Registration Link:").input("https://example.com").run()
+    assert not app.exception
+    assert shown_posts(app) == list(POSTS.values())
+    assert FakeAsyncOpenAI.calls == 1
+
+
+class FakeOpenAI:
+    """Stand-in for openai.OpenAI that reports a batch job in the given status"""
+
+    status = "in_progress"
+
+    def __init__(self, **kwargs):
+        self.batches = SimpleNamespace(retrieve=self.retrieve)
+        self.files = SimpleNamespace(content=self.content)
+
+    def retrieve(self, batch_id):
+        completed = FakeOpenAI.status == "completed"
+        return SimpleNamespace(status=FakeOpenAI.status, output_file_id="file-output" if completed else None)
+
+    def content(self, file_id):
+        body = {"choices": [{"message": {"content": json.dumps(POSTS)}, "finish_reason": "stop"}]}
+        return SimpleNamespace(text=json.dumps({"custom_id": "request-0", "response": {"status_code": 200, "body": body}}))
+
+
+def test_pending_batch_is_collected_on_a_later_rerun():
+    st.cache_resource.clear()
+    FakeOpenAI.status = "in_progress"
+    with mock.patch("openai.OpenAI", FakeOpenAI):
+        at = AppTest.from_file(APP_PATH, default_timeout=30)
+        at.session_state["pending_batch"] = {
+            "provider_key": "openai",
+            "batch_id": "batch-1",
+            "events": [{"event_name": "Meetup", "description": "Talks", "date": "2030-01-01", "time": "18:00",
+                        "venue": "Hall"}],
+            "prompts": ["prompt"],
+            "inputs_hash": None,
+        }
+        at.run()
+        assert not at.exception
+        assert "in_progress" in at.info[0].value
+        assert "pending_batch" in at.session_state
+
+        FakeOpenAI.status = "completed"
+        at.run()
+        assert not at.exception
+        assert "pending_batch" not in at.session_state
+        assert at.session_state["bulk_generated"]["posts"] == [POSTS]